@@ -1,86 +1,101 @@
+import heapq
 import os
+import re
+import sys
 
 from src.file_worker import JSONSaver
 from src.hh_api_worker import HeadHunterAPI
 from src.vacancy_worker import Vacancies
 
 
-# Создание экземпляра класса для работы с API сайтов с вакансиями
-hh_api = HeadHunterAPI(os.path.join("src", "vacancies.json"))
-
-# Получение вакансий с hh.ru в формате JSON
-hh_vacancies = hh_api.load_vacancies("Python")
-
-# Преобразование набора данных из JSON в список объектов
-vacancies_list = Vacancies.cast_to_object_list(hh_vacancies)
-
-# Пример работы контструктора класса с одной вакансией
-vacancy = Vacancies(
-    "Python Developer",
-    "<https://hh.ru/vacancy/123456>",
-    100000150000,
-    "Требования: опыт работы от 3 лет...",
-)
-
-# Сохранение информации о вакансиях в файл
-json_saver = JSONSaver(os.path.join("vacancies.json"))
-json_saver.add_vacancy(vacancy)
-json_saver.delete_vacancy(vacancy.id)
+def salary_of(vacancy):
+    """Возвращает зарплату вакансии числом или None, если она не указана."""
+    salary = vacancy.get("salary")
+    return salary if isinstance(salary, int) else None
+
+
+def filter_vacancies(vacancies, filter_words):
+    """Фильтрует вакансии по ключевым словам в описании."""
+    if not filter_words:
+        return vacancies
+
+    # Ключевые слова приводятся к нижнему регистру один раз, при сборке выражения
+    keywords = [word.lower() for word in filter_words]
+    pattern = re.compile("|".join(map(re.escape, keywords)))
+    return [
+        vacancy
+        for vacancy in vacancies
+        # Описание — один раз на вакансию, а не на каждое слово
+        if pattern.search((vacancy.get("description") or "").lower())
+    ]
+
+
+def get_vacancies_by_salary(vacancies, salary_range):
+    """Возвращает вакансии в заданном диапазоне зарплат."""
+    if not salary_range.strip():
+        return vacancies
+
+    min_part, _, max_part = salary_range.partition("-")
+    try:
+        # int() сам отбрасывает пробелы вокруг чисел
+        min_salary, max_salary = int(min_part), int(max_part)
+    except ValueError:
+        print("Диапазон зарплат не распознан, фильтр по зарплате не применен.")
+        return vacancies
+
+    # Зарплата каждой вакансии вычисляется один раз за проход
+    return [
+        vacancy
+        for vacancy in vacancies
+        if (salary := salary_of(vacancy)) is not None
+        and min_salary <= salary <= max_salary
+    ]
+
+
+def print_vacancies(vacancies):
+    """Выводит список вакансий в удобном формате."""
+    if not vacancies:
+        print("Вакансии не найдены.")
+        return
+
+    # Собираем весь вывод в одну строку и печатаем одной записью
+    parts = []
+    for vacancy in vacancies:
+        salary = salary_of(vacancy)
+        parts.append(
+            f"Название: {vacancy.get('name')}\n"
+            f"Ссылка: {vacancy.get('link')}\n"
+            f"Зарплата: {salary if salary is not None else 'Не указана'}\n"
+            f"Описание: {vacancy.get('description') or 'Нет описания'}\n"
+            + "-" * 40  # Разделитель между вакансиями
+        )
+    sys.stdout.write("\n".join(parts) + "\n")
+
+
+def search_vacancies(vacancies, search_query):
+    """Отбирает вакансии, в названии или описании которых есть поисковый запрос."""
+    query = search_query.strip().lower()
+    if not query:
+        return vacancies
+
+    return [
+        vacancy
+        for vacancy in vacancies
+        if query in (vacancy.get("name") or "").lower()
+        or query in (vacancy.get("description") or "").lower()
+    ]
+
+
+def select_vacancies(vacancies, search_query, filter_words, salary_range, top_n):
+    """Применяет все критерии поиска и возвращает топ N вакансий по зарплате."""
+    found_vacancies = search_vacancies(vacancies, search_query)
+    filtered_vacancies = filter_vacancies(found_vacancies, filter_words)
+    ranged_vacancies = get_vacancies_by_salary(filtered_vacancies, salary_range)
+    # Топ N по зарплате без полной сортировки; вакансии без зарплаты — в конце
+    return heapq.nlargest(top_n, ranged_vacancies, key=lambda v: salary_of(v) or 0)
 
 
 def user_interaction():
-    def filter_vacancies(vacancies, filter_words):
-        """Фильтрует вакансии по ключевым словам в описании."""
-        filtered = []
-        for vacancy in vacancies:
-            if any(
-                word.lower() in vacancy.description.lower() for word in filter_words
-            ):
-                filtered.append(vacancy)
-        return filtered
-
-    def get_vacancies_by_salary(vacancies, salary_range):
-        """Возвращает вакансии в заданном диапазоне зарплат."""
-        if not salary_range:
-            return vacancies
-
-        min_salary, max_salary = map(int, salary_range.split("-"))
-        ranged_vacancies = []
-
-        for vacancy in vacancies:
-            salary = vacancy.salary
-            if isinstance(salary, int) and min_salary <= salary <= max_salary:
-                ranged_vacancies.append(vacancy)
-
-        return ranged_vacancies
-
-    def sort_vacancies(vacancies):
-        """Сортирует вакансии по зарплате по убыванию."""
-        return sorted(vacancies, key=lambda v: v.salary, reverse=True)
-
-    def get_top_vacancies(vacancies, top_n):
-        """Возвращает топ N вакансий по зарплате."""
-        return vacancies[
-            :top_n
-        ]  # Возвращает первые N вакансий из отсортированного списка
-
-    def print_vacancies(vacancies):
-        """Выводит список вакансий в удобном формате."""
-        if not vacancies:
-            print("Вакансии не найдены.")
-            return
-
-        for vacancy in vacancies:
-            print(f"Название: {vacancy.name}")
-            print(f"Ссылка: {vacancy.link}")
-            print(
-                f"Зарплата: {vacancy.salary if isinstance(vacancy.salary, int) else 'Не указана'}"
-            )
-            print(
-                f"Описание: {vacancy.description if vacancy.description else 'Нет описания'}"
-            )
-            print("-" * 40)  # Разделитель между вакансиями
-
     print("Добро пожаловать в систему поиска вакансий!")
 
     search_query = input("Введите поисковый запрос: ")
@@ -101,15 +116,14 @@ def user_interaction():
 
     print("\nПолучение вакансий...")
     json_saver = JSONSaver(os.path.join("vacancies.json"))
-    vacancies_list = json_saver.get_vacancies({"text": search_query})
+    vacancies_list = json_saver.get_vacancies({})
 
     if vacancies_list is None:
         vacancies_list = []
 
-    filtered_vacancies = filter_vacancies(vacancies_list, filter_words)
-    ranged_vacancies = get_vacancies_by_salary(filtered_vacancies, salary_range)
-    sorted_vacancies = sort_vacancies(ranged_vacancies)
-    top_vacancies = get_top_vacancies(sorted_vacancies, top_n)
+    top_vacancies = select_vacancies(
+        vacancies_list, search_query, filter_words, salary_range, top_n
+    )
 
     if top_vacancies:
         print("\nТоп вакансий по зарплате:")
@@ -118,5 +132,28 @@ def user_interaction():
         print("Вакансии не найдены по заданным критериям.")
 
 
-# Запуск взаимодействия с пользователем
-user_interaction()
+if __name__ == "__main__":
+    # Создание экземпляра класса для работы с API сайтов с вакансиями
+    hh_api = HeadHunterAPI(os.path.join("src", "vacancies.json"))
+
+    # Получение вакансий с hh.ru в формате JSON
+    hh_vacancies = hh_api.load_vacancies("Python")
+
+    # Преобразование набора данных из JSON в список объектов
+    vacancies_list = Vacancies.cast_to_object_list(hh_vacancies)
+
+    # Пример работы контструктора класса с одной вакансией
+    vacancy = Vacancies(
+        "Python Developer",
+        "<https://hh.ru/vacancy/123456>",
+        100000150000,
+        "Требования: опыт работы от 3 лет...",
+    )
+
+    # Сохранение информации о вакансиях в файл
+    json_saver = JSONSaver(os.path.join("vacancies.json"))
+    json_saver.add_vacancy(vacancy)
+    json_saver.delete_vacancy(vacancy.id)
+
+    # Запуск взаимодействия с пользователем
+    user_interaction()
@@ -2,6 +2,9 @@ import json
 import os
 from abc import ABC, abstractmethod
 
+# Размер буфера для чтения и записи файла вакансий целиком
+BUFFER_SIZE = 256 * 1024
+
 
 class AbstractVacancyConnector(ABC):
     @abstractmethod
@@ -9,6 +12,11 @@ class AbstractVacancyConnector(ABC):
         """Добавить вакансию."""
         pass
 
+    @abstractmethod
+    def add_vacancies(self, vacancies):
+        """Добавить несколько вакансий."""
+        pass
+
     @abstractmethod
     def get_vacancies(self, criteria):
         """Получить вакансии по указанным критериям."""
@@ -21,63 +29,187 @@ class AbstractVacancyConnector(ABC):
 
 
 class JSONSaver(AbstractVacancyConnector):
+    """Хранит вакансии в формате JSON Lines: одна вакансия на строку."""
+
     def __init__(self, filename):
         self.filename = filename
         if not os.path.exists(self.filename):
-            with open(self.filename, "w", encoding="utf-8") as file:
-                json.dump([], file)  # Создаем пустой файл
+            open(self.filename, "wb").close()  # Создаем пустой файл
+        self._index = None  # id -> [(смещение строки, длина записи)]
+        self._index_stamp = None  # (mtime, размер) файла на момент индексации
+        self._garbage = 0  # байты, занятые удаленными записями
+        self._cache = None  # разобранные вакансии из файла
+        self._cache_stamp = None  # (mtime, размер) файла на момент чтения
+        self._convert_legacy_format()
+
+    def _convert_legacy_format(self):
+        """Переводит файл старого формата (JSON-массив) в JSON Lines."""
+        with open(self.filename, "rb") as file:
+            # Формат определяется по первому непробельному байту
+            chunk = file.read(64)
+            while chunk and not chunk.strip():
+                chunk = file.read(64)
+            if not chunk.lstrip().startswith(b"["):
+                return
+            file.seek(0)
+            vacancies = json.loads(file.read())
+
+        self._rewrite(vacancies)
+
+    def _rewrite(self, vacancies):
+        """Полностью переписывает файл указанными вакансиями."""
+        # Пишем во временный файл и подменяем им старый, чтобы не потерять данные
+        temp_filename = self.filename + ".tmp"
+        with open(temp_filename, "wb", buffering=BUFFER_SIZE) as file:
+            file.write(b"".join(self._encode(vacancy) + b"\n" for vacancy in vacancies))
+        os.replace(temp_filename, self.filename)
+        self._cache = None
+
+    @staticmethod
+    def _encode(vacancy):
+        """Сериализует вакансию в компактную строку JSON в UTF-8."""
+        # Кириллица пишется как есть, а не шестибайтовыми \uXXXX
+        try:
+            return json.dumps(
+                vacancy, ensure_ascii=False, separators=(",", ":")
+            ).encode("utf-8")
+        except UnicodeEncodeError:
+            # Одиночные суррогаты из API нельзя записать в UTF-8 — экранируем их
+            return json.dumps(vacancy, separators=(",", ":")).encode("utf-8")
+
+    def _file_stamp(self):
+        """Возвращает (mtime, размер) файла, чтобы заметить его изменение."""
+        stat = os.stat(self.filename)
+        return stat.st_mtime_ns, stat.st_size
+
+    def _build_index(self):
+        """Строит индекс положения записей в файле за один проход."""
+        self._index = {}
+        self._garbage = 0
+        offset = 0
+        with open(self.filename, "rb", buffering=BUFFER_SIZE) as file:
+            for line in file:
+                record = line.rstrip(b"\n")
+                if record.strip():
+                    vacancy_id = json.loads(record).get("id")
+                    self._index.setdefault(vacancy_id, []).append((offset, len(record)))
+                else:
+                    self._garbage += len(record)
+                offset += len(line)
+        self._index_stamp = self._file_stamp()
+
+    def _ensure_index(self):
+        """Строит индекс при первом удалении и перестраивает, если файл изменился."""
+        if self._index is None or self._file_stamp() != self._index_stamp:
+            self._build_index()
 
     def add_vacancy(self, vacancy_data):
-        vacancy_dict = {
-            "name": vacancy_data.name,
-            "link": vacancy_data.link,
-            "salary": vacancy_data.salary,
-            "description": vacancy_data.description,
-            "id": vacancy_data.id,  # Добавляем id
-        }
-        with open(self.filename, "r+", encoding="utf-8") as file:
-            vacancies = json.load(file)
-            vacancies.append(vacancy_dict)
-            file.seek(0)
-            json.dump(vacancies, file)
-            file.truncate()
+        self.add_vacancies([vacancy_data])
+
+    def add_vacancies(self, vacancies):
+        vacancy_dicts = [
+            {
+                "name": vacancy.name,
+                "link": vacancy.link,
+                "salary": vacancy.salary,
+                "description": vacancy.description,
+                "id": vacancy.id,  # Добавляем id
+            }
+            for vacancy in vacancies
+        ]
+        records = [self._encode(vacancy) for vacancy in vacancy_dicts]
+        index_is_current = (
+            self._index is not None and self._file_stamp() == self._index_stamp
+        )
+        # Дописываем все строки в конец файла одной записью, не перечитывая его
+        with open(self.filename, "ab", buffering=BUFFER_SIZE) as file:
+            offset = file.tell()
+            file.write(b"".join(record + b"\n" for record in records))
+        self._cache = None
+
+        if not index_is_current:
+            # Индекс построится заново при следующем удалении
+            self._index = None
+            return
+        for vacancy, record in zip(vacancy_dicts, records):
+            self._index.setdefault(vacancy["id"], []).append((offset, len(record)))
+            offset += len(record) + 1
+        self._index_stamp = self._file_stamp()
+
+    def _read_vacancies(self):
+        """Построчно читает вакансии из файла, пропуская пустые строки."""
+        with open(self.filename, "rb", buffering=BUFFER_SIZE) as file:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+
+    def _cached_vacancies(self):
+        """Возвращает вакансии из памяти; файл перечитывается только после изменения."""
+        stamp = self._file_stamp()
+        if self._cache is None or stamp != self._cache_stamp:
+            self._cache = list(self._read_vacancies())
+            self._cache_stamp = stamp
+        return self._cache
 
     def get_vacancies(self, criteria):
-        with open(self.filename, "r", encoding="utf-8") as file:
-            vacancies = json.load(file)
-            result = []
-
-            for vacancy in vacancies:
-                matches = True  # Флаг для отслеживания соответствия
-                for key, value in criteria.items():
-                    if (
-                        vacancy.get(key) != value
-                    ):  # Если хоть одно значение не совпадает
-                        matches = False
-                        break  # Выходим из цикла, если не совпало
-
-                if matches:
-                    result.append(vacancy)
-
-            return result
+        result = []
+
+        for vacancy in self._cached_vacancies():
+            matches = True  # Флаг для отслеживания соответствия
+            for key, value in criteria.items():
+                if vacancy.get(key) != value:  # Если хоть одно значение не совпадает
+                    matches = False
+                    break  # Выходим из цикла, если не совпало
+
+            if matches:
+                # Копия, чтобы изменения у вызывающего не попали в кэш
+                result.append(dict(vacancy))
+
+        return result
+
+    def _pop_positions(self, vacancy_id):
+        """Извлекает из индекса положения записей, которые нужно удалить."""
+        # Записи без id удаляются вместе с искомой, как и раньше
+        return [
+            (expected_id, offset, length)
+            for expected_id in dict.fromkeys((vacancy_id, None))
+            for offset, length in self._index.pop(expected_id, [])
+        ]
+
+    def _is_record_at(self, file, expected_id, offset, length):
+        """Проверяет, что по смещению в файле все еще лежит ожидаемая запись."""
+        file.seek(offset)
+        data = file.read(length + 1)
+        if len(data) < length or data[length:] not in (b"\n", b""):
+            return False
+        try:
+            return json.loads(data[:length]).get("id") == expected_id
+        except (ValueError, AttributeError):
+            return False
 
     def delete_vacancy(self, vacancy_id):
-        with open(self.filename, "r+", encoding="utf-8") as file:
-            vacancies = json.load(file)
-
-            not_suitable = []
-
-            for vacancy in vacancies:
-                if vacancy.get("id") == None:
-                    vacancy.get("id", "Нет айди")
-                elif vacancy.get("id") != vacancy_id:
-                    not_suitable.append(vacancy)
-
-            # Перемещаем указатель файла в начало
-            file.seek(0)
-
-            # Очищаем файл
-            file.truncate()
-
-            # Записываем обновленный список вакансий в файл
-            json.dump(not_suitable, file)
+        self._ensure_index()
+        with open(self.filename, "rb+") as file:
+            positions = self._pop_positions(vacancy_id)
+            if not all(self._is_record_at(file, *position) for position in positions):
+                # Файл изменили в обход индекса — строим его заново
+                self._build_index()
+                positions = self._pop_positions(vacancy_id)
+            if not positions:
+                return
+
+            # Затираем записи пробелами на месте, не сдвигая остальные строки
+            for expected_id, offset, length in positions:
+                file.seek(offset)
+                file.write(b" " * length)
+                self._garbage += length
+        self._cache = None
+        self._index_stamp = self._file_stamp()
+
+        if self._garbage * 2 > os.path.getsize(self.filename):
+            self.compact()
+
+    def compact(self):
+        """Переписывает файл без удаленных записей."""
+        self._rewrite(list(self._read_vacancies()))
+        self._build_index()
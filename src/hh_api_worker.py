@@ -2,6 +2,8 @@ import json
 import os
 import requests
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 
 
 class Parser(ABC):
@@ -19,24 +21,73 @@ class HeadHunterAPI(Parser):
     Класс Parser является родительским классом, который вам необходимо реализовать
     """
 
+    max_pages = 20
+    max_workers = 10
+
     def __init__(self, file_worker):
         self.url = "https://api.hh.ru/vacancies"
         self.headers = {"User-Agent": "HH-User-Agent"}
         self.params = {"text": "", "page": 0, "per_page": 100}
         self.vacancies = []
+        self._seen_ids = set()  # id уже загруженных вакансий
+        # Одна сессия на все запросы: соединения с api.hh.ru переиспользуются
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.max_pages, pool_maxsize=self.max_pages
+        )
+        self.session.mount("https://", adapter)
         super().__init__(file_worker)
 
+    def _get_page(self, keyword, page):
+        """Запрашивает одну страницу выдачи с собственной копией параметров."""
+        params = {**self.params, "text": keyword, "page": page}
+        return self.session.get(self.url, headers=self.headers, params=params)
+
+    def _add_vacancies(self, vacancies):
+        """Добавляет вакансии, пропуская уже загруженные по id."""
+        # Страницы выдачи HH могут пересекаться
+        for vacancy in vacancies:
+            vacancy_id = vacancy.get("id")
+            if vacancy_id not in self._seen_ids:
+                self._seen_ids.add(vacancy_id)
+                self.vacancies.append(vacancy)
+
     def load_vacancies(self, keyword):
-        self.params["text"] = keyword
-        while self.params["page"] < 20:
-            response = requests.get(self.url, headers=self.headers, params=self.params)
-            if response.status_code != 200:
-                print(f"Ошибка при запросе: {response.status_code}")
-                return []  # Возвращаем пустой список в случае ошибки
-
-            vacancies = response.json().get("items", [])
-            if not vacancies:
-                break
-            self.vacancies.extend(vacancies)
-            self.params["page"] += 1
+        # Первая страница сообщает, сколько всего страниц в выдаче
+        response = self._get_page(keyword, 0)
+        if response.status_code != 200:
+            print(f"Ошибка при запросе: {response.status_code}")
+            return []  # Возвращаем пустой список в случае ошибки
+
+        data = json.loads(response.content)
+        vacancies = data.get("items", [])
+        if not vacancies:
+            return self.vacancies
+        self._add_vacancies(vacancies)
+
+        pages = min(data.get("pages", self.max_pages), self.max_pages)
+        if pages <= 1:
+            return self.vacancies
+
+        # Остальные страницы запрашиваем параллельно
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(self._get_page, keyword, page)
+                for page in range(1, pages)
+            ]
+            for future in futures:
+                response = future.result()
+                if response.status_code != 200:
+                    print(f"Ошибка при запросе: {response.status_code}")
+                    for pending in futures:
+                        pending.cancel()
+                    return []  # Возвращаем пустой список в случае ошибки
+
+                vacancies = json.loads(response.content).get("items", [])
+                if not vacancies:
+                    # Выдача закончилась — оставшиеся запросы не нужны
+                    for pending in futures:
+                        pending.cancel()
+                    break
+                self._add_vacancies(vacancies)
         return self.vacancies
@@ -1,17 +1,18 @@
+import functools
+from dataclasses import dataclass
+
+
+@functools.total_ordering
+@dataclass(slots=True, eq=False, repr=False)
 class Vacancies:
-    def __init__(
-        self,
-        name: str,
-        link: str,
-        salary: int = 0,
-        description: str = "",
-        id: str = None,
-    ):
-        self.name = name
-        self.link = link
-        self.salary = self.validation_data(salary)
-        self.description = description
-        self.id = id
+    name: str
+    link: str
+    salary: int = 0
+    description: str = ""
+    id: str = None
+
+    def __post_init__(self):
+        self.salary = self.validation_data(self.salary)
 
     def validation_data(self, salary):
         if salary is None or salary == "":
@@ -42,34 +43,14 @@ class Vacancies:
         return object_list
 
     def __lt__(self, other):
-        if not isinstance(other, Vacancies):
+        if type(other) is not Vacancies:
             return NotImplemented
         return self.salary < other.salary
 
-    def __le__(self, other):
-        if not isinstance(other, Vacancies):
-            return NotImplemented
-        return self.salary <= other.salary
-
     def __eq__(self, other):
-        if not isinstance(other, Vacancies):
+        if type(other) is not Vacancies:
             return NotImplemented
         return self.salary == other.salary
 
-    def __ne__(self, other):
-        if not isinstance(other, Vacancies):
-            return NotImplemented
-        return self.salary != other.salary
-
-    def __gt__(self, other):
-        if not isinstance(other, Vacancies):
-            return NotImplemented
-        return self.salary > other.salary
-
-    def __ge__(self, other):
-        if not isinstance(other, Vacancies):
-            return NotImplemented
-        return self.salary >= other.salary
-
     def __repr__(self):
         return f"Vacancies(name={self.name}, link={self.link}, salary={self.salary}, description={self.description})"
@@ -0,0 +1,184 @@
+import os
+
+from src.file_worker import JSONSaver
+from src.vacancy_worker import Vacancies
+
+
+def make_vacancy(vacancy_id, salary=100000, name="Python Developer"):
+    return Vacancies(
+        name, f"https://hh.ru/vacancy/{vacancy_id}", salary, "Опыт от 3 лет", vacancy_id
+    )
+
+
+def ids(saver):
+    return [vacancy["id"] for vacancy in JSONSaver(saver.filename).get_vacancies({})]
+
+
+def test_add_get_delete_round_trip(tmp_path):
+    saver = JSONSaver(str(tmp_path / "vacancies.json"))
+    saver.add_vacancy(make_vacancy("1", name="Разработчик"))
+    saver.add_vacancy(make_vacancy("2", salary=150000))
+    saver.add_vacancy(make_vacancy("3"))
+
+    assert saver.get_vacancies({"id": "2"}) == [
+        {
+            "name": "Python Developer",
+            "link": "https://hh.ru/vacancy/2",
+            "salary": 150000,
+            "description": "Опыт от 3 лет",
+            "id": "2",
+        }
+    ]
+    assert saver.get_vacancies({"name": "Разработчик"})[0]["id"] == "1"
+
+    saver.delete_vacancy("2")
+    assert ids(saver) == ["1", "3"]
+
+
+def test_add_appends_one_line(tmp_path):
+    filename = tmp_path / "vacancies.json"
+    saver = JSONSaver(str(filename))
+    saver.add_vacancy(make_vacancy("1"))
+    saver.add_vacancy(make_vacancy("2"))
+
+    assert len(filename.read_bytes().splitlines()) == 2
+
+
+def test_blank_lines_are_skipped(tmp_path):
+    filename = tmp_path / "vacancies.json"
+    filename.write_bytes(b'\n{"id":"1"}\n   \n\n{"id":"2"}\n')
+    saver = JSONSaver(str(filename))
+
+    assert saver.get_vacancies({}) == [{"id": "1"}, {"id": "2"}]
+    saver.delete_vacancy("2")
+    assert saver.get_vacancies({}) == [{"id": "1"}]
+
+
+def test_old_json_array_file_is_converted(tmp_path):
+    filename = tmp_path / "vacancies.json"
+    filename.write_text(' [{"id": "1", "salary": 5}, {"id": "2", "salary": 7}]')
+    saver = JSONSaver(str(filename))
+
+    assert saver.get_vacancies({}) == [
+        {"id": "1", "salary": 5},
+        {"id": "2", "salary": 7},
+    ]
+    assert not (tmp_path / "vacancies.json.tmp").exists()
+
+    filename.write_text("[]")
+    assert JSONSaver(str(filename)).get_vacancies({}) == []
+
+
+def test_leading_whitespace_does_not_hide_old_format(tmp_path):
+    filename = tmp_path / "vacancies.json"
+    filename.write_text(" " * 200 + '[{"id": "1"}]')
+
+    assert JSONSaver(str(filename)).get_vacancies({}) == [{"id": "1"}]
+
+
+def test_delete_blanks_record_in_place_then_compacts(tmp_path):
+    filename = tmp_path / "vacancies.json"
+    saver = JSONSaver(str(filename))
+    for vacancy_id in "0123":
+        saver.add_vacancy(make_vacancy(vacancy_id))
+
+    size = filename.stat().st_size
+    saver.delete_vacancy("0")
+    assert filename.stat().st_size == size
+    assert filename.read_bytes().splitlines()[0].strip() == b""
+
+    saver.delete_vacancy("1")
+    saver.delete_vacancy("2")
+    assert filename.read_bytes().count(b"\n") == 1
+    assert ids(saver) == ["3"]
+
+
+def test_two_savers_on_one_file(tmp_path):
+    filename = str(tmp_path / "vacancies.json")
+    first = JSONSaver(filename)
+    for vacancy_id in "012345":
+        first.add_vacancy(make_vacancy(vacancy_id))
+    second = JSONSaver(filename)
+    second.delete_vacancy("missing")  # второй экземпляр строит свой индекс
+
+    for vacancy_id in "0123":
+        first.delete_vacancy(vacancy_id)  # приводит к compact()
+    first.add_vacancy(make_vacancy("9"))
+    second.delete_vacancy("4")
+
+    assert b"\x00" not in open(filename, "rb").read()
+    assert ids(first) == ["5", "9"]
+
+
+def test_delete_checks_record_before_blanking(tmp_path):
+    filename = tmp_path / "vacancies.json"
+    saver = JSONSaver(str(filename))
+    saver.add_vacancy(make_vacancy("1"))
+    saver.add_vacancy(make_vacancy("2"))
+    saver.delete_vacancy("missing")
+
+    # Файл меняют в обход индекса, сохраняя его размер и время изменения
+    stat = filename.stat()
+    lines = filename.read_bytes().splitlines(keepends=True)
+    filename.write_bytes(lines[1] + lines[0])
+    os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    saver.delete_vacancy("1")
+    assert ids(saver) == ["2"]
+
+
+def test_add_vacancies_appends_batch(tmp_path):
+    filename = tmp_path / "vacancies.json"
+    saver = JSONSaver(str(filename))
+    saver.add_vacancy(make_vacancy("0"))
+    saver.delete_vacancy("missing")  # индекс уже построен
+    saver.add_vacancies([make_vacancy(str(i), name="Разработчик") for i in range(1, 4)])
+
+    assert ids(saver) == ["0", "1", "2", "3"]
+    saver.delete_vacancy("2")
+    assert ids(saver) == ["0", "1", "3"]
+
+    saver.add_vacancies([])
+    assert ids(saver) == ["0", "1", "3"]
+
+
+def test_cached_results_are_copies(tmp_path):
+    saver = JSONSaver(str(tmp_path / "vacancies.json"))
+    saver.add_vacancy(make_vacancy("1"))
+
+    saver.get_vacancies({})[0]["salary"] = -1
+    assert saver.get_vacancies({})[0]["salary"] == 100000
+
+
+def test_cache_sees_writes_from_other_saver(tmp_path):
+    filename = str(tmp_path / "vacancies.json")
+    reader = JSONSaver(filename)
+    writer = JSONSaver(filename)
+    writer.add_vacancy(make_vacancy("1"))
+    assert [v["id"] for v in reader.get_vacancies({})] == ["1"]
+
+    writer.add_vacancy(make_vacancy("2"))
+    writer.delete_vacancy("1")
+    assert [v["id"] for v in reader.get_vacancies({})] == ["2"]
+
+
+def test_records_are_stored_as_compact_utf8(tmp_path):
+    filename = tmp_path / "vacancies.json"
+    saver = JSONSaver(str(filename))
+    saver.add_vacancy(make_vacancy("1", name="Разработчик"))
+
+    assert filename.read_bytes().startswith('{"name":"Разработчик",'.encode("utf-8"))
+    assert saver.get_vacancies({})[0]["name"] == "Разработчик"
+
+
+def test_lone_surrogate_is_stored(tmp_path):
+    saver = JSONSaver(str(tmp_path / "vacancies.json"))
+    broken = Vacancies("Python", "link", 1, "\ud83d", "1")
+    saver.add_vacancies([broken, make_vacancy("2")])
+
+    assert [vacancy["description"] for vacancy in saver.get_vacancies({})] == [
+        "\ud83d",
+        "Опыт от 3 лет",
+    ]
+    saver.delete_vacancy("1")
+    assert ids(saver) == ["2"]
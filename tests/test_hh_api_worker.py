@@ -0,0 +1,85 @@
+import json
+
+from src.hh_api_worker import HeadHunterAPI
+
+
+class FakeResponse:
+    def __init__(self, status_code, data=None):
+        self.status_code = status_code
+        self.data = data or {}
+        self.content = json.dumps(self.data).encode("utf-8")
+
+    def json(self):
+        return self.data
+
+
+class FakeSession:
+    """Отдает заранее заданные ответы по номеру страницы."""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.pages = []
+
+    def get(self, url, headers=None, params=None):
+        self.pages.append(params["page"])
+        return self.responses.get(params["page"], FakeResponse(200, {"items": []}))
+
+
+def make_api(responses):
+    hh_api = HeadHunterAPI("vacancies.json")
+    hh_api.session = FakeSession(responses)
+    return hh_api
+
+
+def page(*vacancy_ids, pages=None):
+    data = {"items": [{"id": vacancy_id} for vacancy_id in vacancy_ids]}
+    if pages is not None:
+        data["pages"] = pages
+    return FakeResponse(200, data)
+
+
+def test_stops_on_empty_page():
+    hh_api = make_api(
+        {0: page("1", pages=5), 1: page("2"), 2: page(), 3: page("4"), 4: page("5")}
+    )
+
+    assert [vacancy["id"] for vacancy in hh_api.load_vacancies("Python")] == ["1", "2"]
+
+
+def test_requests_only_reported_pages():
+    hh_api = make_api({0: page("1", pages=2), 1: page("2")})
+
+    assert [vacancy["id"] for vacancy in hh_api.load_vacancies("Python")] == ["1", "2"]
+    assert sorted(hh_api.session.pages) == [0, 1]
+
+
+def test_page_params_are_not_shared():
+    hh_api = make_api({0: page("1", pages=3), 1: page("2"), 2: page("3")})
+    hh_api.load_vacancies("Python")
+
+    assert hh_api.params == {"text": "", "page": 0, "per_page": 100}
+
+
+def test_error_in_batch_returns_empty_list():
+    hh_api = make_api({0: page("1", pages=3), 1: FakeResponse(500), 2: page("3")})
+
+    assert hh_api.load_vacancies("Python") == []
+
+
+def test_error_on_first_page_returns_empty_list():
+    hh_api = make_api({0: FakeResponse(403)})
+
+    assert hh_api.load_vacancies("Python") == []
+
+
+def test_duplicates_across_pages_are_skipped():
+    hh_api = make_api(
+        {0: page("1", "2", pages=4), 1: page("2", "3"), 2: page("2"), 3: page("4")}
+    )
+
+    assert [vacancy["id"] for vacancy in hh_api.load_vacancies("Python")] == [
+        "1",
+        "2",
+        "3",
+        "4",
+    ]
@@ -0,0 +1,144 @@
+import importlib
+import sys
+
+import pytest
+import requests
+
+import main
+
+
+def test_import_makes_no_requests(monkeypatch, tmp_path):
+    def fail(*args, **kwargs):
+        raise AssertionError("HTTP-запрос при импорте main")
+
+    monkeypatch.setattr(requests, "get", fail)
+    monkeypatch.setattr(requests.Session, "request", fail)
+    monkeypatch.chdir(tmp_path)
+    sys.modules.pop("main", None)
+
+    importlib.import_module("main")
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def vacancy(vacancy_id, salary, name="Python Developer", description=""):
+    return {
+        "id": vacancy_id,
+        "name": name,
+        "link": f"https://hh.ru/vacancy/{vacancy_id}",
+        "salary": salary,
+        "description": description,
+    }
+
+
+def test_search_matches_name_or_description():
+    vacancies = [
+        vacancy("1", 100000, name="Python Developer"),
+        vacancy("2", 100000, name="Backend", description="Опыт с PYTHON"),
+        vacancy("3", 100000, name="Java Developer"),
+    ]
+
+    assert [v["id"] for v in main.search_vacancies(vacancies, "python")] == ["1", "2"]
+    assert main.search_vacancies(vacancies, "  ") == vacancies
+
+
+def test_select_vacancies_applies_all_criteria():
+    vacancies = [
+        vacancy("1", 90000, description="Django"),
+        vacancy("2", 200000, description="Django"),
+        vacancy("3", 120000, description="Flask"),
+        vacancy("4", 130000, description="Django"),
+        vacancy("5", 140000, name="Java Developer", description="Django"),
+    ]
+
+    top = main.select_vacancies(vacancies, "python", ["django"], "100000-150000", 5)
+
+    assert [v["id"] for v in top] == ["4"]
+
+
+def test_select_vacancies_top_n_keeps_order_of_ties():
+    vacancies = [
+        vacancy("1", 100000),
+        vacancy("2", 150000),
+        vacancy("3", 100000),
+        vacancy("4", "Зарплата не указана"),
+        vacancy("5", 100000),
+    ]
+
+    top = main.select_vacancies(vacancies, "", [], "", 4)
+
+    assert [v["id"] for v in top] == ["2", "1", "3", "5"]
+
+
+def test_filter_vacancies_is_case_insensitive():
+    vacancies = [
+        vacancy("1", 100000, description="Python, Django"),
+        vacancy("2", 100000, description="JAVA"),
+        vacancy("3", 100000, description="Знание ПИТОНА"),
+        vacancy("4", 100000, description=None),
+        vacancy("5", 100000, description="C++ (Qt)"),
+    ]
+
+    def filtered(words):
+        return [v["id"] for v in main.filter_vacancies(vacancies, words)]
+
+    assert filtered(["DJANGO"]) == ["1"]
+    assert filtered(["java", "питон"]) == ["2", "3"]
+    assert filtered(["c++", "(qt)"]) == ["5"]
+    assert filtered(["ПиТоН"]) == filtered(["питон", "котлин"]) == ["3"]
+    assert main.filter_vacancies(vacancies, []) == vacancies
+
+
+def test_salary_range_with_spaces(capsys):
+    vacancies = [
+        vacancy("1", 90000),
+        vacancy("2", 100000),
+        vacancy("3", 150000),
+        vacancy("4", "Зарплата не указана"),
+    ]
+
+    ranged = main.get_vacancies_by_salary(vacancies, "100000 - 150000")
+
+    assert [v["id"] for v in ranged] == ["2", "3"]
+    assert capsys.readouterr().out == ""
+
+
+@pytest.mark.parametrize("salary_range", ["abc", "100000", "100000-", "abc-def"])
+def test_unparsable_salary_range_is_reported(capsys, salary_range):
+    vacancies = [vacancy("1", 90000), vacancy("2", 100000)]
+
+    assert main.get_vacancies_by_salary(vacancies, salary_range) == vacancies
+    assert "Диапазон зарплат не распознан" in capsys.readouterr().out
+
+
+def test_empty_salary_range_is_not_reported(capsys):
+    vacancies = [vacancy("1", 90000)]
+
+    assert main.get_vacancies_by_salary(vacancies, " ") == vacancies
+    assert capsys.readouterr().out == ""
+
+
+def test_print_vacancies_output(capsys):
+    main.print_vacancies(
+        [
+            vacancy("1", 100000, name="Python Developer", description="Django"),
+            vacancy("2", "Зарплата не указана", name="Junior"),
+        ]
+    )
+
+    assert capsys.readouterr().out == (
+        "Название: Python Developer\n"
+        "Ссылка: https://hh.ru/vacancy/1\n"
+        "Зарплата: 100000\n"
+        "Описание: Django\n" + "-" * 40 + "\n"
+        "Название: Junior\n"
+        "Ссылка: https://hh.ru/vacancy/2\n"
+        "Зарплата: Не указана\n"
+        "Описание: Нет описания\n" + "-" * 40 + "\n"
+    )
+
+
+def test_print_vacancies_empty(capsys):
+    main.print_vacancies([])
+
+    assert capsys.readouterr().out == "Вакансии не найдены.\n"
@@ -0,0 +1,75 @@
+from types import SimpleNamespace
+
+import pytest
+
+from src.vacancy_worker import Vacancies
+
+
+def test_vacancy_has_no_instance_dict():
+    vacancy = Vacancies("Python Developer", "https://hh.ru/vacancy/1", 100000)
+
+    assert not hasattr(vacancy, "__dict__")
+    assert vacancy.name == "Python Developer"
+    assert vacancy.salary == 100000
+
+
+def test_comparisons_use_salary():
+    junior = Vacancies("Junior", "link", 50000)
+    senior = Vacancies("Senior", "link", 150000)
+    other_senior = Vacancies("Lead", "other link", 150000)
+
+    assert junior < senior
+    assert junior <= senior
+    assert senior > junior
+    assert senior >= other_senior
+    assert senior == other_senior
+    assert junior != senior
+    assert sorted([senior, junior]) == [junior, senior]
+
+
+def test_comparison_with_other_types_is_not_supported():
+    vacancy = Vacancies("Python Developer", "link", 100000)
+
+    assert vacancy != 100000
+    with pytest.raises(TypeError):
+        vacancy < 100000
+
+
+def test_salary_is_validated_on_creation():
+    assert Vacancies("Python", "link").salary == 0
+    assert Vacancies("Python", "link", None).salary == "Зарплата не указана"
+    assert Vacancies("Python", "link", "").salary == "Зарплата не указана"
+
+    with pytest.raises(ValueError):
+        Vacancies("Python", "link", -1)
+    with pytest.raises(ValueError):
+        Vacancies("Python", "link", "100000")
+
+
+def test_cast_to_object_list():
+    vacancies = Vacancies.cast_to_object_list(
+        [
+            {
+                "id": "1",
+                "name": "Python Developer",
+                "alternate_url": "https://hh.ru/vacancy/1",
+                "salary": {"from": 100000},
+                "snippet": {"requirement": "Django"},
+            },
+            {"id": "2", "name": "Junior", "salary": None, "snippet": {}},
+        ]
+    )
+
+    assert [(v.id, v.salary, v.description) for v in vacancies] == [
+        ("1", 100000, "Django"),
+        ("2", 0, ""),
+    ]
+
+
+def test_comparison_requires_exact_vacancies_type():
+    vacancy = Vacancies("Python Developer", "link", 100000)
+    look_alike = SimpleNamespace(salary=100000)
+
+    assert vacancy.__eq__(look_alike) is NotImplemented
+    assert vacancy.__lt__(look_alike) is NotImplemented
+    assert vacancy != look_alike